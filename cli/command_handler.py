@@ -3,10 +3,13 @@ import asyncio
 import os
 import re
 import shlex
+import sys
 import datetime
-from typing import List
+from typing import List, Tuple
 import time
 import shutil
+from types import MappingProxyType
+from functools import lru_cache
 import aiofiles
 from colorama import Fore, Style
 from config.config_manager import config_manager, logger
@@ -16,9 +19,126 @@ from utils.web_search import WebSearchHandler
 from cli.web_commands import WebCommands
 from project import ProjectCommandHandler
 
+# Longest command line whose shlex tokens are memoised
+_SHLEX_CACHE_MAX_INPUT = 512
+
+
+@lru_cache(maxsize=256)
+def _cached_shlex_split(user_input: str) -> Tuple[str, ...]:
+    """Split a quoted command line, memoising results for repeated input."""
+    return tuple(shlex.split(user_input))
+
+
+# Colour codes used by command output, bound once at import
+_FG_CYAN = Fore.CYAN
+_FG_GREEN = Fore.GREEN
+_FG_YELLOW = Fore.YELLOW
+_FG_RED = Fore.RED
+_RESET = Style.RESET_ALL
+
+# Usage signatures shown by ":help <command>"
+_COMMAND_SIGS = {
+    ":help": ":help [command]",
+    ":context": ":context <file1> [file2] ...",
+    ":create": ":create <filename> <prompt>",
+    ":edit": ":edit <filename> <prompt>",
+    ":move": ":move <source> <destination>",
+    ":test": ":test <test_file>",
+    ":debug": ":debug <code_file> <test_file>",
+    ":exec": ":exec <code>",
+    ":auto": ":auto <prompt>",
+    ":develop": ":develop <prompt> [file1 file2 ...]",
+    ":explain": ":explain <filename>",
+    ":refactor": ":refactor <filename> [type]",
+    ":analyze": ":analyze <filename>",
+    ":docs": ":docs <filename> [format]",
+    ":generate-tests": ":generate-tests <filename>",
+    ":project": ":project create|list|info|set <args>",
+    ":git": ":git init|add|commit|status <args>",
+    ":search": ":search <query> [file_pattern]",
+    ":template": ":template list|use <args>",
+    ":metrics": ":metrics [reset]",
+    ":config": ":config get|set|show <args>",
+    ":model": ":model [model_name]",
+    ":clear": ":clear",
+    ":exit": ":exit",
+}
+
+# Accepted values for :refactor types and :docs formats
+_VALID_REFACTOR_TYPES = frozenset({"general", "performance", "readability", "structure", "patterns"})
+_VALID_REFACTOR_STR = "general, performance, readability, structure, patterns"
+_VALID_DOC_FORMATS = frozenset({"markdown", "rst", "html"})
+_VALID_DOC_FORMATS_STR = "markdown, rst, html"
+
+# Rows of the general help table: (command, arguments, description)
+_HELP_ROWS = (
+    (":help", "[command]", "Show help information"),
+    (":context", "<file1> [file2] ...", "Set context files for the AI"),
+    (":create", "<filename> <prompt>", "Create a new file from a prompt"),
+    (":edit", "<filename> <prompt>", "Edit an existing file with AI assistance"),
+    (":move", "<source> <destination>", "Move/rename a file"),
+    (":test", "<test_file>", "Run unit tests"),
+    (":debug", "<code_file> <test_file>", "Debug code to fix failing tests"),
+    (":exec", "<code>", "Execute Python code"),
+    (":auto", "<prompt>", "Auto-develop a simple project"),
+    (":develop", "<prompt> [file1 file2 ...]", "Develop a project with data files"),
+    (":explain", "<filename>", "Explain code in a file"),
+    (":refactor", "<filename> [type]",
+     "Refactor code (types: general, performance, readability, structure, patterns)"),
+    (":analyze", "<filename>", "Analyze code quality"),
+    (":docs", "<filename> [format]", "Generate documentation (formats: markdown, rst, html)"),
+    (":generate-tests", "<filename>", "Generate unit tests for a file"),
+    (":project", "create|list|info|set|rename|remove|analyze|debug|improve <args>", "Project management commands"),
+    (":git", "init|add|commit|status <args>", "Git operations"),
+    (":search", "<query> [file_pattern]", "Search for code in project"),
+    (":template", "list|use <args>", "Work with project templates"),
+    (":metrics", "[reset]", "Show performance metrics"),
+    (":config", "get|set|show <args>", "Configuration management"),
+    (":model", "[model_name]", "Get or set the active AI model"),
+    (":clear", "", "Clear the terminal screen"),
+    (":dialogue", "<model1> <model2> <topic> [--turns=N] [--verbose]",
+     "Create a dialogue between two AI models"),
+    (":exit", "", "Exit the application")
+)
+
+
 class CommandHandler:
     """Handles command parsing and execution for the CLI interface."""
 
+    # Command name -> handler method name; bound per instance in __init__
+    _COMMAND_TABLE = (
+        (":help", "_help_command"),
+        (":context", "_context_command"),
+        (":create", "_create_command"),
+        (":edit", "_edit_command"),
+        (":move", "_move_command"),
+        (":test", "_test_command"),
+        (":debug", "_debug_command"),
+        (":exec", "_exec_command"),
+        (":auto", "_auto_command"),
+        (":develop", "_develop_command"),
+        (":explain", "_explain_command"),
+        (":refactor", "_refactor_command"),
+        (":analyze", "_analyze_command"),
+        (":docs", "_docs_command"),
+        (":generate-tests", "_generate_tests_command"),
+        (":project", "_project_command"),
+        (":git", "_git_command"),
+        # (":search", "_search_command"),
+        (":template", "_template_command"),
+        (":metrics", "_metrics_command"),
+        (":config", "_config_command"),
+        (":show-config", "_config_show_command"),
+        (":model", "_model_command"),
+        (":clear", "_clear_command"),
+        (":dialogue", "_dialogue_command"),
+        (":web", "_web_command"),
+        (":explain-url", "_explain_url_command"),
+        (":search", "_search_shortcut"),
+        (":exit", "_exit_command"),
+        ("exit", "_exit_command"),
+    )
+
     def __init__(self, dev_assistant: DevAssistant):
         self.dev_assistant = dev_assistant
         try:
@@ -26,53 +146,54 @@ class CommandHandler:
             self.web_commands = WebCommands(self.web_search_handler)
             logger.info("Web commands initialized")
         except Exception as e:
-            logger.error(f"Failed to initialize web search: {e}")
+            logger.error("Failed to initialize web search: %s", e)
             self.web_search_handler = None
             self.web_commands = None
 
-        self.commands = {
-            ":help": self._help_command,
-            ":context": self._context_command,
-            ":create": self._create_command,
-            ":edit": self._edit_command,
-            ":move": self._move_command,
-            ":test": self._test_command,
-            ":debug": self._debug_command,
-            ":exec": self._exec_command,
-            ":auto": self._auto_command,
-            ":develop": self._develop_command,
-            ":explain": self._explain_command,
-            ":refactor": self._refactor_command,
-            ":analyze": self._analyze_command,
-            ":docs": self._docs_command,
-            ":generate-tests": self._generate_tests_command,
-            ":project": self._project_command,
-            ":git": self._git_command,
-            # ":search": self._search_command,
-            ":template": self._template_command,
-            ":metrics": self._metrics_command,
-            ":config": self._config_command,
-            ":show-config": self._config_show_command,
-            ":model": self._model_command,
-            ":clear": self._clear_command,
-            ":dialogue": self._dialogue_command,
-            ":web": self._web_command,
-            ":explain-url": self._explain_url_command,
-            ":search": self._search_shortcut,
-            ":exit": self._exit_command,
+        self.commands = MappingProxyType({
+            name: getattr(self, method_name) for name, method_name in self._COMMAND_TABLE
+        })
+
+        # Subcommand tables for commands that dispatch on their first argument
+        self._git_subcommands = {
+            "init": self._git_init,
+            "add": self._git_add,
+            "commit": self._git_commit,
+            "status": self._git_status,
+        }
+        self._config_subcommands = {
+            "get": self._config_get,
+            "set": self._config_set,
+            "show": self._config_show,
         }
+        self._template_subcommands = {
+            "list": self._template_list,
+            "use": self._template_use,
+        }
+        self.project_handler = ProjectCommandHandler(self.dev_assistant)
+
+        # Rendered general help text and the version it was rendered for
+        self._general_help_cache = None
+        self._general_help_bytes = None
+        self._general_help_version = None
         logger.info("CommandHandler initialized")
 
     def parse_command(self, user_input: str) -> List[str]:
         """Parse user input into command arguments."""
         # If input doesn't start with a command prefix, treat it as plain conversation
-        if not user_input.startswith(':'):
+        if not user_input or user_input[0] != ':':
             return [user_input]
 
+        # Without quotes or escapes shlex would split on whitespace anyway
+        if '"' not in user_input and "'" not in user_input and '\\' not in user_input:
+            return user_input.split()
+
         try:
+            if len(user_input) <= _SHLEX_CACHE_MAX_INPUT:
+                return list(_cached_shlex_split(user_input))
             return shlex.split(user_input)
         except Exception as e:
-            logger.error(f"Error parsing command: {e}")
+            logger.error("Error parsing command: %s", e)
             return user_input.split()
 
     async def _explain_url_command(self, args: List[str]) -> str:
@@ -97,17 +218,13 @@ class CommandHandler:
 
         command = command_args[0]
 
-        # Handle exit command directly
-        if command.lower() == "exit":
-            return ":exit"
-
         # Check if command exists
         handler = self.commands.get(command)
         if handler:
             try:
                 return await handler(command_args[1:])
             except Exception as e:
-                logger.error(f"Error executing command {command}: {e}", exc_info=True)
+                logger.error("Error executing command %s: %s", command, e, exc_info=True)
                 return f"Error executing command {command}: {e}"
         else:
             # Treat as conversation if not a recognized command
@@ -121,103 +238,55 @@ class CommandHandler:
             doc = self.commands[command].__doc__ or "No documentation available."
 
             # Get signature for the command
-            sig = None
-            if command == ":help":
-                sig = ":help [command]"
-            elif command == ":context":
-                sig = ":context <file1> [file2] ..."
-            elif command == ":create":
-                sig = ":create <filename> <prompt>"
-            elif command == ":edit":
-                sig = ":edit <filename> <prompt>"
-            elif command == ":move":
-                sig = ":move <source> <destination>"
-            elif command == ":test":
-                sig = ":test <test_file>"
-            elif command == ":debug":
-                sig = ":debug <code_file> <test_file>"
-            elif command == ":exec":
-                sig = ":exec <code>"
-            elif command == ":auto":
-                sig = ":auto <prompt>"
-            elif command == ":develop":
-                sig = ":develop <prompt> [file1 file2 ...]"
-            elif command == ":explain":
-                sig = ":explain <filename>"
-            elif command == ":refactor":
-                sig = ":refactor <filename> [type]"
-            elif command == ":analyze":
-                sig = ":analyze <filename>"
-            elif command == ":docs":
-                sig = ":docs <filename> [format]"
-            elif command == ":generate-tests":
-                sig = ":generate-tests <filename>"
-            elif command == ":project":
-                sig = ":project create|list|info|set <args>"
-            elif command == ":git":
-                sig = ":git init|add|commit|status <args>"
-            elif command == ":search":
-                sig = ":search <query> [file_pattern]"
-            elif command == ":template":
-                sig = ":template list|use <args>"
-            elif command == ":metrics":
-                sig = ":metrics [reset]"
-            elif command == ":config":
-                sig = ":config get|set|show <args>"
-            elif command == ":model":
-                sig = ":model [model_name]"
-            elif command == ":clear":
-                sig = ":clear"
-            elif command == ":exit":
-                sig = ":exit"
-
-            return f"{Fore.CYAN}{sig}{Style.RESET_ALL}\n{doc}"
-
-        # Show general help
-        help_text = f"{Fore.CYAN}AI Development Assistant v{config_manager.get('version', '2.0.0')}{Style.RESET_ALL}\n\n"
-        help_text += f"{Fore.YELLOW}Available Commands:{Style.RESET_ALL}\n"
-
-        commands = [
-            (":help", "[command]", "Show help information"),
-            (":context", "<file1> [file2] ...", "Set context files for the AI"),
-            (":create", "<filename> <prompt>", "Create a new file from a prompt"),
-            (":edit", "<filename> <prompt>", "Edit an existing file with AI assistance"),
-            (":move", "<source> <destination>", "Move/rename a file"),
-            (":test", "<test_file>", "Run unit tests"),
-            (":debug", "<code_file> <test_file>", "Debug code to fix failing tests"),
-            (":exec", "<code>", "Execute Python code"),
-            (":auto", "<prompt>", "Auto-develop a simple project"),
-            (":develop", "<prompt> [file1 file2 ...]", "Develop a project with data files"),
-            (":explain", "<filename>", "Explain code in a file"),
-            (":refactor", "<filename> [type]",
-             "Refactor code (types: general, performance, readability, structure, patterns)"),
-            (":analyze", "<filename>", "Analyze code quality"),
-            (":docs", "<filename> [format]", "Generate documentation (formats: markdown, rst, html)"),
-            (":generate-tests", "<filename>", "Generate unit tests for a file"),
-            (":project", "create|list|info|set|rename|remove|analyze|debug|improve <args>", "Project management commands"),
-            (":git", "init|add|commit|status <args>", "Git operations"),
-            (":search", "<query> [file_pattern]", "Search for code in project"),
-            (":template", "list|use <args>", "Work with project templates"),
-            (":metrics", "[reset]", "Show performance metrics"),
-            (":config", "get|set|show <args>", "Configuration management"),
-            (":model", "[model_name]", "Get or set the active AI model"),
-            (":clear", "", "Clear the terminal screen"),
-            (":dialogue", "<model1> <model2> <topic> [--turns=N] [--verbose]",
-             "Create a dialogue between two AI models"),
-            (":exit", "", "Exit the application")
-        ]
-
-        # Calculate column widths
-        cmd_width = max(len(cmd[0]) for cmd in commands) + 2
-        args_width = max(len(cmd[1]) for cmd in commands) + 2
+            sig = _COMMAND_SIGS.get(command, command)
+
+            return f"{_FG_CYAN}{sig}{_RESET}\n{doc}"
+
+        return self._render_general_help()
+
+    def _render_general_help(self) -> str:
+        """Return the general help text, rebuilt only when the reported version changes."""
+        version = config_manager.get('version', '2.0.0')
+        if self._general_help_cache is not None and self._general_help_version == version:
+            return self._general_help_cache
+
+        parts = [f"{_FG_CYAN}AI Development Assistant v{version}{_RESET}\n\n",
+                 f"{_FG_YELLOW}Available Commands:{_RESET}\n"]
+
+        # Calculate column widths in a single pass over the rows
+        cmd_width = args_width = 0
+        for cmd, args, _ in _HELP_ROWS:
+            if len(cmd) > cmd_width:
+                cmd_width = len(cmd)
+            if len(args) > args_width:
+                args_width = len(args)
+        cmd_width += 2
+        args_width += 2
 
         # Format commands
-        for cmd, args, desc in commands:
-            help_text += f"  {Fore.GREEN}{cmd:<{cmd_width}}{Style.RESET_ALL}{args:<{args_width}}{desc}\n"
+        for cmd, args, desc in _HELP_ROWS:
+            parts.append(f"  {_FG_GREEN}{cmd:<{cmd_width}}{_RESET}{args:<{args_width}}{desc}\n")
 
-        help_text += f"\n{Fore.YELLOW}Type any text without a command prefix to chat with the AI.{Style.RESET_ALL}"
+        parts.append(f"\n{_FG_YELLOW}Type any text without a command prefix to chat with the AI.{_RESET}")
+
+        help_text = "".join(parts)
+        self._general_help_cache = help_text
+        self._general_help_bytes = help_text.encode("utf-8") + b"\n"
+        self._general_help_version = version
         return help_text
 
+    def write_general_help(self) -> None:
+        """Write the general help text to the terminal, reusing the pre-encoded bytes when possible."""
+        help_text = self._render_general_help()
+        # A replaced sys.stdout (e.g. colorama's Windows converter) must see the text itself
+        if sys.stdout is not sys.__stdout__ or not hasattr(sys.stdout, "buffer"):
+            print(help_text)
+            return
+
+        sys.stdout.flush()
+        sys.stdout.buffer.write(self._general_help_bytes)
+        sys.stdout.buffer.flush()
+
     async def _context_command(self, args: List[str]) -> str:
         """Set context files for the AI."""
         if not args:
@@ -291,7 +360,7 @@ class CommandHandler:
             return "Usage: :develop <prompt> [file1 file2 ...]\nProvide a prompt and optional data files."
 
         prompt = args[0]
-        data_files = args[1:] if len(args) > 1 else []
+        data_files = args[1:]
         return await self.dev_assistant.auto_develop(prompt, data_files)
 
     async def _explain_command(self, args: List[str]) -> str:
@@ -309,10 +378,9 @@ class CommandHandler:
 
         filename = args[0]
         refactor_type = args[1] if len(args) > 1 else "general"
-        valid_types = ["general", "performance", "readability", "structure", "patterns"]
 
-        if refactor_type not in valid_types:
-            return f"Invalid refactor type: {refactor_type}\nValid types: {', '.join(valid_types)}"
+        if refactor_type not in _VALID_REFACTOR_TYPES:
+            return f"Invalid refactor type: {refactor_type}\nValid types: {_VALID_REFACTOR_STR}"
 
         return await self.dev_assistant.refactor_code(filename, refactor_type)
 
@@ -331,10 +399,9 @@ class CommandHandler:
 
         filename = args[0]
         doc_format = args[1] if len(args) > 1 else "markdown"
-        valid_formats = ["markdown", "rst", "html"]
 
-        if doc_format not in valid_formats:
-            return f"Invalid documentation format: {doc_format}\nValid formats: {', '.join(valid_formats)}"
+        if doc_format not in _VALID_DOC_FORMATS:
+            return f"Invalid documentation format: {doc_format}\nValid formats: {_VALID_DOC_FORMATS_STR}"
 
         return await self.dev_assistant.generate_documentation_file(filename, doc_format)
 
@@ -347,8 +414,7 @@ class CommandHandler:
         return await self.dev_assistant.generate_tests(filename)
 
     async def _project_command(self, args: List[str]) -> str:
-        project_handler = ProjectCommandHandler(self.dev_assistant)
-        return await project_handler.execute(args)
+        return await self.project_handler.execute(args)
 
     async def _git_command(self, args: List[str]) -> str:
         """Git operations."""
@@ -364,30 +430,29 @@ class CommandHandler:
         if not self.dev_assistant.current_project:
             return "No active project. Use :project set <name> to select a project first."
 
-        project_dir = self.dev_assistant.current_project.directory
+        handler = self._git_subcommands.get(subcmd)
+        if not handler:
+            return f"Unknown git subcommand: {subcmd}\nAvailable: init, add, commit, status"
 
-        if subcmd == "init":
-            return await self.dev_assistant.git_manager.init_repo(project_dir)
+        return await handler(self.dev_assistant.current_project.directory, args[1:])
 
-        elif subcmd == "add":
-            if len(args) > 1:
-                files = args[1:]
-                return await self.dev_assistant.git_manager.add_files(project_dir, files)
-            else:
-                return await self.dev_assistant.git_manager.add_files(project_dir)
+    async def _git_init(self, project_dir: str, args: List[str]) -> str:
+        return await self.dev_assistant.git_manager.init_repo(project_dir)
 
-        elif subcmd == "commit":
-            if len(args) < 2:
-                return "Usage: :git commit <message>"
+    async def _git_add(self, project_dir: str, args: List[str]) -> str:
+        if args:
+            return await self.dev_assistant.git_manager.add_files(project_dir, args)
+        return await self.dev_assistant.git_manager.add_files(project_dir)
 
-            message = " ".join(args[1:])
-            return await self.dev_assistant.git_manager.commit(project_dir, message)
+    async def _git_commit(self, project_dir: str, args: List[str]) -> str:
+        if not args:
+            return "Usage: :git commit <message>"
 
-        elif subcmd == "status":
-            return await self.dev_assistant.git_manager.status(project_dir)
+        message = " ".join(args)
+        return await self.dev_assistant.git_manager.commit(project_dir, message)
 
-        else:
-            return f"Unknown git subcommand: {subcmd}\nAvailable: init, add, commit, status"
+    async def _git_status(self, project_dir: str, args: List[str]) -> str:
+        return await self.dev_assistant.git_manager.status(project_dir)
 
     async def _search_command(self, args: List[str]) -> str:
         """Search for code in project."""
@@ -405,28 +470,30 @@ class CommandHandler:
             return "Usage: :template list|use <args>"
 
         subcmd = args[0]
+        handler = self._template_subcommands.get(subcmd)
+        if not handler:
+            return f"Unknown template subcommand: {subcmd}\nAvailable: list, use"
 
-        if subcmd == "list":
-            return await self.dev_assistant.list_templates()
+        return await handler(args[1:])
 
-        elif subcmd == "use":
-            if len(args) < 3:
-                return "Usage: :template use <template_name> <output_dir> [param1=value1 param2=value2 ...]"
+    async def _template_list(self, args: List[str]) -> str:
+        return await self.dev_assistant.list_templates()
 
-            template_name = args[1]
-            output_dir = args[2]
+    async def _template_use(self, args: List[str]) -> str:
+        if len(args) < 2:
+            return "Usage: :template use <template_name> <output_dir> [param1=value1 param2=value2 ...]"
 
-            # Parse optional parameters
-            params = {}
-            for param in args[3:]:
-                if "=" in param:
-                    key, value = param.split("=", 1)
-                    params[key] = value
+        template_name = args[0]
+        output_dir = args[1]
 
-            return await self.dev_assistant.use_template(template_name, output_dir, params)
+        # Parse optional parameters
+        params = {}
+        for param in args[2:]:
+            key, sep, value = param.partition("=")
+            if sep:
+                params[key] = value
 
-        else:
-            return f"Unknown template subcommand: {subcmd}\nAvailable: list, use"
+        return await self.dev_assistant.use_template(template_name, output_dir, params)
 
     async def _metrics_command(self, args: List[str]) -> str:
         """Show performance metrics."""
@@ -443,45 +510,49 @@ class CommandHandler:
             return "Usage: :config get|set|show <args>"
 
         subcmd = args[0]
+        handler = self._config_subcommands.get(subcmd)
+        if not handler:
+            return f"Unknown config subcommand: {subcmd}\nAvailable: get, set, show"
 
-        if subcmd == "get":
-            if len(args) < 2:
-                return "Usage: :config get <key>"
+        return await handler(args[1:])
 
-            key = args[1]
-            value = config_manager.get(key, "Key not found")
-            return f"{key} = {value}"
+    async def _config_get(self, args: List[str]) -> str:
+        if not args:
+            return "Usage: :config get <key>"
+
+        key = args[0]
+        value = config_manager.get(key, "Key not found")
+        return f"{key} = {value}"
 
-        elif subcmd == "set":
-            if len(args) < 3:
-                return "Usage: :config set <key> <value>"
+    async def _config_set(self, args: List[str]) -> str:
+        if len(args) < 2:
+            return "Usage: :config set <key> <value>"
 
-            key = args[1]
-            value = args[2]
+        key = args[0]
+        value = args[1]
 
-            # Try to convert value to appropriate type
+        # Try to convert value to appropriate type
+        lowered = value.lower()
+        if lowered == "true":
+            value = True
+        elif lowered == "false":
+            value = False
+        else:
             try:
-                if value.lower() == "true":
-                    value = True
-                elif value.lower() == "false":
-                    value = False
-                elif value.isdigit():
-                    value = int(value)
-                elif value.replace(".", "", 1).isdigit():
+                value = int(value)
+            except ValueError:
+                try:
                     value = float(value)
-            except:
-                pass  # Keep as string if conversion fails
+                except ValueError:
+                    pass  # Keep as string if conversion fails
 
-            config_manager.set(key, value)
-            config_manager.save_config()
-            return f"Configuration updated: {key} = {value}"
+        config_manager.set(key, value)
+        config_manager.save_config()
+        return f"Configuration updated: {key} = {value}"
 
-        elif subcmd == "show":
-            config_manager.print_config()
-            return ""  # Already printed via the config manager
-
-        else:
-            return f"Unknown config subcommand: {subcmd}\nAvailable: get, set, show"
+    async def _config_show(self, args: List[str]) -> str:
+        config_manager.print_config()
+        return ""  # Already printed via the config manager
 
     async def _model_command(self, args: List[str]) -> str:
         """Get or set the active AI model."""
@@ -542,7 +613,7 @@ class CommandHandler:
             return "Please provide a topic for the dialogue."
 
         # Display information
-        print(f"{Fore.CYAN}Starting dialogue between {len(models)} models on: {topic}{Style.RESET_ALL}")
+        print(f"{_FG_CYAN}Starting dialogue between {len(models)} models on: {topic}{_RESET}")
         print(f"Models: {', '.join(models)}")
         print(f"Number of turns per model: {turns}")
 
@@ -587,7 +658,7 @@ class CommandHandler:
 
             # Show which model is responding
             model_turn = (turn - 1) // len(models) + 1
-            print(f"\n{Fore.YELLOW}[Round {model_turn}, {current_model}]{Style.RESET_ALL}")
+            print(f"\n{_FG_YELLOW}[Round {model_turn}, {current_model}]{_RESET}")
 
             # Show thinking indicator
             if not verbose:
@@ -623,7 +694,7 @@ class CommandHandler:
                     if "Chunk too big" in error_str:
                         # If context is too large, reduce it further
                         print(
-                            f"\n{Fore.RED}Error: Context too large. Retrying with smaller context... ({retry_count}/{max_retries}){Style.RESET_ALL}")
+                            f"\n{_FG_RED}Error: Context too large. Retrying with smaller context... ({retry_count}/{max_retries}){_RESET}")
                         # Cut the dialogue history in half for next attempt
                         max_context_turns = max_context_turns // 2
                         if max_context_turns < 1:
@@ -638,14 +709,14 @@ class CommandHandler:
 
     Your turn to respond (briefly, under 150 words):"""
                     else:
-                        print(f"\n{Fore.RED}Error: {e}. Retrying... ({retry_count}/{max_retries}){Style.RESET_ALL}")
+                        print(f"\n{_FG_RED}Error: {e}. Retrying... ({retry_count}/{max_retries}){_RESET}")
                         await asyncio.sleep(1)  # Brief pause before retry
 
             # If all retries failed, use a fallback response
             if response is None:
                 response = f"[I apologize, but I encountered a technical issue and couldn't generate a proper response for the dialogue. Let's continue the conversation.]"
                 print(
-                    f"\n{Fore.RED}Failed to get response after {max_retries} attempts. Using fallback response.{Style.RESET_ALL}")
+                    f"\n{_FG_RED}Failed to get response after {max_retries} attempts. Using fallback response.{_RESET}")
 
             # Add the response to the dialogue
             dialogue.append(f"[{current_model}]: {response}")
@@ -694,7 +765,7 @@ class CommandHandler:
                 else:
                     await f.write(f"## Entry {i}\n\n{entry}\n\n")
 
-        return f"\n{Fore.GREEN}Dialogue completed!{Style.RESET_ALL}\nSaved to: {filepath}"
+        return f"\n{_FG_GREEN}Dialogue completed!{_RESET}\nSaved to: {filepath}"
 
     async def _web_command(self, args: List[str]) -> str:
         """Execute web operations."""
@@ -728,7 +799,7 @@ class CommandHandler:
             self.web_commands = WebCommands(self.web_search_handler)
             logger.info("Web commands initialized on-demand")
         except ImportError as e:
-            logger.error(f"Failed to import web search modules: {e}")
+            logger.error("Failed to import web search modules: %s", e)
             raise ImportError(f"Web search functionality requires additional modules: {e}")
 
     async def _config_show_command(self, args: List[str]) -> str:
@@ -744,6 +815,6 @@ class CommandHandler:
                 await self.web_commands.search_handler.close()
                 logger.info("Web search session closed successfully")
             except Exception as e:
-                logger.error(f"Error closing web search session: {e}")
+                logger.error("Error closing web search session: %s", e)
 
         return ":exit"
\ No newline at end of file
@@ -4,7 +4,7 @@ import os
 import time
 import json
 import aiofiles
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 
 from config.config_manager import logger
 
@@ -21,11 +21,19 @@ class Project:
         self.last_modified = time.time()
         self.tags: List[str] = []
         self.metadata: Dict[str, Any] = {}
+        self._last_scan: Optional[float] = None  # time.monotonic() of the last completed scan
         os.makedirs(directory, exist_ok=True)
         logger.info(f"Project initialized: {name} in {directory}")
 
-    async def scan_files(self) -> None:
-        """Scan the project directory for files."""
+    async def scan_files(self, max_age: float = 0.0) -> None:
+        """Scan the project directory for files.
+
+        If max_age is given, a scan completed less than max_age seconds ago
+        is reused instead of walking the directory again.
+        """
+        if max_age and self._last_scan is not None and time.monotonic() - self._last_scan < max_age:
+            return
+
         self.files = {}
 
         # Directories to exclude from project listing
@@ -62,6 +70,7 @@ class Project:
                 except Exception as e:
                     logger.error(f"Error scanning file {path}: {e}")
 
+        self._last_scan = time.monotonic()
         logger.info(f"Scanned {len(self.files)} files in project {self.name}")
 
     def to_dict(self) -> Dict[str, Any]:
@@ -1,20 +1,24 @@
 # project_command_handler.py
-from typing import List
+from typing import Dict, List, Tuple
 from colorama import Fore, Style
-import datetime
 import os
 import re
+import shutil
+import time
 import aiofiles
 
+_FG_CYAN = Fore.CYAN
+_FG_GREEN = Fore.GREEN
+_RESET = Style.RESET_ALL
+_TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
+# Seconds a project file scan is reused across :project subcommands
+_SCAN_MAX_AGE = 5.0
+
+
 class ProjectCommandHandler:
     def __init__(self, dev_assistant):
         self.dev_assistant = dev_assistant
-
-    async def execute(self, args: List[str]) -> str:
-        if not args:
-            return "Usage: :project create|list|info|set|rename|remove|analyze|debug|improve <args>"
-        subcmd = args[0]
-        dispatch = {
+        self.subcommands = {
             "create": self.create_project,
             "list": self.list_projects,
             "info": self.project_info,
@@ -25,7 +29,14 @@ class ProjectCommandHandler:
             "debug": self.debug_project,
             "improve": self.improve_project,
         }
-        handler = dispatch.get(subcmd)
+        # Rendered :project info text per project name, tagged with last_modified
+        self._info_cache: Dict[str, Tuple[float, str]] = {}
+
+    async def execute(self, args: List[str]) -> str:
+        if not args:
+            return "Usage: :project create|list|info|set|rename|remove|analyze|debug|improve <args>"
+        subcmd = args[0]
+        handler = self.subcommands.get(subcmd)
         if not handler:
             return f"Unknown project subcommand: {subcmd}"
         return await handler(args[1:])
@@ -41,12 +52,12 @@ class ProjectCommandHandler:
         projects = await self.dev_assistant.project_manager.list_projects()
         if not projects:
             return "No projects found."
-        result = [f"{Fore.CYAN}Available Projects:{Style.RESET_ALL}"]
+        result = [f"{_FG_CYAN}Available Projects:{_RESET}"]
         for i, proj in enumerate(projects, 1):
             desc = proj['description'] if len(proj['description']) <= 50 else proj['description'][:50] + '...'
-            result.append(f"{i}. {Fore.GREEN}{proj['name']}{Style.RESET_ALL} - {desc}")
-            result.append(f"   Directory: {proj['directory']}")
-            result.append(f"   Files: {proj.get('file_count', 'N/A')}")
+            result.extend((f"{i}. {_FG_GREEN}{proj['name']}{_RESET} - {desc}",
+                           f"   Directory: {proj['directory']}",
+                           f"   Files: {proj.get('file_count', 'N/A')}"))
         return "\n".join(result)
 
     async def project_info(self, args: List[str]) -> str:
@@ -61,17 +72,27 @@ class ProjectCommandHandler:
             if not project:
                 return "No project specified or selected."
 
-        await project.scan_files()  # Update file listing
+        await project.scan_files(max_age=_SCAN_MAX_AGE)  # Update file listing
 
-        result = [f"{Fore.CYAN}Project: {project.name}{Style.RESET_ALL}",
-                  f"Description: {project.description}",
-                  f"Directory: {project.directory}",
-                  f"Created: {datetime.datetime.fromtimestamp(project.created_at).strftime('%Y-%m-%d %H:%M:%S')}",
-                  f"Last modified: {datetime.datetime.fromtimestamp(project.last_modified).strftime('%Y-%m-%d %H:%M:%S')}"]
+        cached = self._info_cache.get(project.name)
+        if cached and cached[0] == project.last_modified:
+            return cached[1]
+
+        created_str = time.strftime(_TIMESTAMP_FORMAT, time.localtime(project.created_at))
+        if project.last_modified == project.created_at:
+            modified_str = created_str
+        else:
+            modified_str = time.strftime(_TIMESTAMP_FORMAT, time.localtime(project.last_modified))
+        info = (f"{_FG_CYAN}Project: {project.name}{_RESET}\n"
+                f"Description: {project.description}\n"
+                f"Directory: {project.directory}\n"
+                f"Created: {created_str}\n"
+                f"Last modified: {modified_str}")
         if project.tags:
-            result.append(f"Tags: {', '.join(project.tags)}")
+            info += f"\nTags: {', '.join(project.tags)}"
         # (Include additional formatting such as file counts and tree display as needed)
-        return "\n".join(result)
+        self._info_cache[project.name] = (project.last_modified, info)
+        return info
 
     async def set_project(self, args: List[str]) -> str:
         if len(args) < 1:
@@ -96,6 +117,7 @@ class ProjectCommandHandler:
         await project.save()
         # Update tracking in project manager
         del self.dev_assistant.project_manager.projects[old_name]
+        self._info_cache.pop(old_name, None)
         self.dev_assistant.project_manager.projects[new_name] = project
         if self.dev_assistant.current_project and self.dev_assistant.current_project.name == old_name:
             self.dev_assistant.current_project = project
@@ -111,11 +133,11 @@ class ProjectCommandHandler:
             return f"Project '{project_name}' not found."
         directory = project.directory
         del self.dev_assistant.project_manager.projects[project_name]
+        self._info_cache.pop(project_name, None)
         if self.dev_assistant.current_project and self.dev_assistant.current_project.name == project_name:
             self.dev_assistant.current_project = None
         if delete_files:
             try:
-                import shutil
                 shutil.rmtree(directory)
                 return f"Project '{project_name}' removed and all files deleted from {directory}"
             except Exception as e:
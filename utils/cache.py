@@ -4,6 +4,7 @@ import json
 import os
 import time
 import hashlib
+import heapq
 import asyncio
 import aiofiles
 from typing import Dict, Any, Optional, Tuple
@@ -299,19 +300,18 @@ class ResponseCache:
         if len(self.memory_cache) <= self.max_memory_items:
             return
 
-        # Sort by last access time (oldest first)
         items_to_remove = len(self.memory_cache) - self.max_memory_items
 
+        # Select only the victims instead of sorting the whole cache
         if self.eviction_policy == "lru":
-            # Sort by last access time
-            sorted_items = sorted(self.memory_cache.items(), key=lambda x: x[1].last_access)
+            # Oldest last access time first
+            victims = heapq.nsmallest(items_to_remove, self.memory_cache.items(), key=lambda x: x[1].last_access)
         else:
-            # Sort by hit count
-            sorted_items = sorted(self.memory_cache.items(), key=lambda x: x[1].hits)
+            # Lowest hit count first
+            victims = heapq.nsmallest(items_to_remove, self.memory_cache.items(), key=lambda x: x[1].hits)
 
         # Remove oldest/least used items
-        for i in range(items_to_remove):
-            key, _ = sorted_items[i]
+        for key, _ in victims:
             self.memory_cache.pop(key, None)
 
         logger.debug(f"Memory cache cleanup: removed {items_to_remove} items, "
@@ -233,6 +233,10 @@ class StructuredLogger(logging.Logger):
     def _log_with_extras(self, level, msg, args, exc_info=None, extra=None,
                          stack_info=False, stacklevel=1):
         """Log with extra data stored in the structured log record."""
+        # Skip record construction (and message formatting) for filtered levels
+        if not self.isEnabledFor(level):
+            return
+
         # Extract any extra data for structured logging
         structured_extra = {}
         if extra: